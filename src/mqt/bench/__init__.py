@@ -17,6 +17,7 @@ from mqt.bench.benchmark_generation import (
     get_benchmark_indep,
     get_benchmark_mapped,
     get_benchmark_native_gates,
+    get_benchmarks_batch,
 )
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "get_benchmark_indep",
     "get_benchmark_mapped",
     "get_benchmark_native_gates",
+    "get_benchmarks_batch",
 ]
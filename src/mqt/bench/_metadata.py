@@ -0,0 +1,26 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Package metadata shared by the benchmark generation and the exporters."""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib import metadata
+
+
+@cache
+def get_installed_version() -> str:
+    """Return the installed version of MQT Bench.
+
+    Looking up package metadata scans the import path, so a successful lookup is done once per process.
+
+    Raises:
+        Exception: If the version cannot be determined, e.g., because `mqt.bench` is not installed.
+    """
+    return metadata.version("mqt.bench")
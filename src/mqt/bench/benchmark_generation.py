@@ -10,22 +10,44 @@
 
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
+import os
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
 from enum import Enum, auto
-from typing import TYPE_CHECKING, overload
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
 
 import numpy as np
-from qiskit import generate_preset_pass_manager
-from qiskit.circuit import ClassicalRegister, QuantumCircuit, SessionEquivalenceLibrary
-from qiskit.compiler import transpile
-from qiskit.converters import circuit_to_dag
-from qiskit.transpiler import Layout, Target
-from typing_extensions import assert_never
+from qiskit import __version__ as _qiskit_version
+from qiskit.circuit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.transpiler import Layout
 
+from ._metadata import get_installed_version
 from .benchmarks import create_circuit
 from .targets.gatesets import get_target_for_gateset, ionq, rigetti
 
+# The transpiler entry points are imported inside the functions that compile circuits,
+# so that the algorithm level (and plain ``import mqt.bench``) does not depend on them.
+
 if TYPE_CHECKING:  # pragma: no cover
-    from qiskit.transpiler import Target
+    from collections.abc import Iterable, Mapping
+    from types import ModuleType
+
+    from qiskit.transpiler import PassManager, StagedPassManager, Target
+
+
+# Vendors whose targets require custom gate equivalences, keyed by the name in the target description.
+_VENDOR_EQUIVALENCES: dict[str, ModuleType] = {"rigetti": rigetti, "ionq": ionq}
+_REGISTERED_EQUIVALENCES: set[str] = set()
+_TWO_PI = 2 * np.pi
+
+# Environment variable pointing to a directory for the persistent circuit cache (disabled if unset).
+_CACHE_DIR_ENV_VAR = "MQT_BENCH_CACHE_DIR"
 
 
 class BenchmarkLevel(Enum):
@@ -37,6 +59,135 @@ class BenchmarkLevel(Enum):
     MAPPED = auto()
 
 
+@lru_cache(maxsize=64)
+def _build_circuit(benchmark: str, circuit_size: int, random_parameters: bool) -> QuantumCircuit:
+    """Creates the canonical circuit for a named benchmark.
+
+    All benchmark factories and the random parameter assignment are seeded, so the result only
+    depends on the arguments and is cached. The cached circuit must not be mutated; callers
+    receive a copy via `_get_circuit`.
+
+    Arguments:
+        benchmark: Name of the benchmark for which the circuit is to be created.
+        circuit_size: Size of the circuit to be created.
+        random_parameters: If True, assigns random parameters to the circuit's parameters if they exist.
+
+    Returns:
+        QuantumCircuit: Constructed quantum circuit based on the given parameters.
+    """
+    cache_file = _get_cache_file(benchmark, circuit_size, random_parameters)
+    if cache_file is not None:
+        cached = _load_cached_circuit(cache_file)
+        if cached is not None:
+            return cached
+
+    qc = _assign_random_parameters(create_circuit(benchmark, circuit_size), random_parameters)
+
+    if cache_file is not None:
+        _store_cached_circuit(cache_file, qc)
+    return qc
+
+
+def _load_cached_circuit(cache_file: Path) -> QuantumCircuit | None:
+    """Load a circuit from the persistent cache.
+
+    Missing or unreadable entries are cache misses. Corrupt entries are cache misses as well and are
+    removed, so that they are rewritten.
+
+    Arguments:
+        cache_file: Path of the cache entry.
+
+    Returns:
+        The cached circuit, or None on a cache miss.
+    """
+    # Open the entry directly instead of checking for it first, which saves a `stat` per lookup.
+    try:
+        with cache_file.open("rb") as f:
+            qc = pickle.load(f)
+    except OSError:
+        return None
+    except Exception:  # noqa: BLE001
+        # Unpickling a damaged entry can raise almost any exception.
+        qc = None
+
+    if isinstance(qc, QuantumCircuit):
+        return qc
+    with suppress(OSError):
+        cache_file.unlink(missing_ok=True)
+    return None
+
+
+def _store_cached_circuit(cache_file: Path, qc: QuantumCircuit) -> None:
+    """Store a circuit in the persistent cache.
+
+    Writing is best-effort: if the entry cannot be written, the circuit is simply not cached.
+
+    Arguments:
+        cache_file: Path of the cache entry.
+        qc: Circuit to be stored.
+    """
+    # Write to a temporary file first so that concurrent readers never see partial entries.
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_file.open("wb") as f:
+            pickle.dump(qc, f)
+        tmp_file.replace(cache_file)
+    except (OSError, pickle.PicklingError):
+        return
+    finally:
+        with suppress(OSError):
+            tmp_file.unlink(missing_ok=True)
+
+
+def _get_cache_file(benchmark: str, circuit_size: int, random_parameters: bool) -> Path | None:
+    """Return the file of the persistent circuit cache for a named benchmark.
+
+    The persistent cache is opt-in: it is only used if the `MQT_BENCH_CACHE_DIR` environment
+    variable points to a directory. Entries are keyed by the MQT Bench and Qiskit versions, so
+    upgrading either of them never serves stale circuits. Circuits are stored as pickles (QPY does
+    not round-trip all benchmark gates); only point the variable to a directory you trust.
+
+    Arguments:
+        benchmark: Name of the benchmark.
+        circuit_size: Size of the circuit.
+        random_parameters: Whether random parameters are assigned.
+
+    Returns:
+        The path of the cache entry, or None if the persistent cache is disabled.
+    """
+    cache_dir = os.environ.get(_CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    try:
+        version = get_installed_version()
+    except Exception:  # noqa: BLE001
+        # Broken installations can fail with more than `PackageNotFoundError`.
+        return None
+
+    key = f"{version}|{_qiskit_version}|{benchmark}|{circuit_size}|{random_parameters}"
+    return Path(cache_dir) / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.pickle"
+
+
+def _assign_random_parameters(qc: QuantumCircuit, random_parameters: bool) -> QuantumCircuit:
+    """Binds seeded random values to all parameters of a circuit in place, if requested.
+
+    Arguments:
+        qc: Circuit whose parameters are to be bound.
+        random_parameters: If True, assigns random parameters to the circuit's parameters if they exist.
+
+    Returns:
+        QuantumCircuit: The (possibly modified) input circuit.
+    """
+    if random_parameters and qc.num_parameters > 0:
+        rng = np.random.default_rng(10)
+        # Draw all values in a single call; this yields the same stream as drawing them one by one.
+        values = rng.uniform(0, _TWO_PI, size=qc.num_parameters).tolist()
+        # Bind positionally (in the order of `qc.parameters`) to avoid building a parameter-keyed mapping.
+        qc.assign_parameters(values, inplace=True)
+    return qc
+
+
 def _get_circuit(
     benchmark: str | QuantumCircuit,
     circuit_size: int | None,
@@ -45,7 +196,8 @@ def _get_circuit(
     """Creates a raw quantum circuit based on the specified benchmark.
 
     This function generates a quantum circuit according to the specifications of the
-    desired benchmark.
+    desired benchmark. Circuits for named benchmarks are served from a cache and copied,
+    so the returned circuit can be modified freely.
 
     Arguments:
         benchmark: Name of the benchmark for which the circuit is to be created.
@@ -54,25 +206,37 @@ def _get_circuit(
 
     Returns:
         QuantumCircuit: Constructed quantum circuit based on the given parameters.
+
+    Raises:
+        TypeError: If `benchmark` is neither a str nor a QuantumCircuit.
+        ValueError: If `circuit_size` does not match the type of `benchmark`.
     """
     if isinstance(benchmark, QuantumCircuit):
         if circuit_size is not None:
             msg = "`circuit_size` must be omitted or None when `benchmark` is a QuantumCircuit."
             raise ValueError(msg)
-        qc = benchmark
+        return _assign_random_parameters(benchmark, random_parameters)
 
-    else:
-        if circuit_size is None:
-            msg = "`circuit_size` cannot be None when `benchmark` is a str."
-            raise ValueError(msg)
-        qc = create_circuit(benchmark, circuit_size)
+    if not isinstance(benchmark, str):
+        msg = f"`benchmark` must be a str or a QuantumCircuit, got {type(benchmark).__name__}."
+        raise TypeError(msg)
+    if circuit_size is None:
+        msg = "`circuit_size` cannot be None when `benchmark` is a str."
+        raise ValueError(msg)
+    return _build_circuit(benchmark, circuit_size, random_parameters).copy()
 
-    if len(qc.parameters) > 0 and random_parameters:
-        rng = np.random.default_rng(10)
-        param_dict = {param: rng.uniform(0, 2 * np.pi) for param in qc.parameters}
-        qc.assign_parameters(param_dict, inplace=True)
-        assert len(qc.parameters) == 0, "All parameters should be assigned."
-    return qc
+
+@lru_cache(maxsize=16)
+def _get_trivial_layout(qregs: tuple[QuantumRegister, ...]) -> Layout:
+    """Return the trivial layout of the given quantum registers.
+
+    Registers compare equal by name and size, so the layout can be shared between circuits with the
+    same registers. Callers must copy the returned layout before attaching it to a circuit.
+
+    Arguments:
+        qregs: Quantum registers to include in the layout, in order.
+    """
+    return Layout.generate_trivial_layout(*qregs)
 
 
 def _create_mirror_circuit(
@@ -80,11 +244,11 @@ def _create_mirror_circuit(
 ) -> QuantumCircuit:
     """Generates the mirror version (qc @ qc.inverse()) of a given quantum circuit.
 
-    For circuits with an initial layout (e.g., mapped circuits), this function ensures
-    that the final layout of the mirrored circuit matches the initial layout of the
-    original circuit. While Qiskit's `inverse()` and `compose()` methods correctly track
-    the permutation of qubits, this benchmark requires that the final qubit permutation
-    is identical to the initial one, requiring the explicit layout handling herein.
+    The inverse is formed by appending the inverse of each instruction in reverse order to the
+    circuit itself, followed by resetting the global phase, as the phases of the circuit and
+    its inverse cancel out. For circuits with an initial layout (e.g., mapped circuits), this
+    function ensures that the final layout of the mirrored circuit matches the initial layout
+    of the original circuit, since the inverse undoes the qubit permutation caused by routing.
     Also ensures that the mirrored circuit respects the native gate set of the target device
     if a target is provided.
 
@@ -103,18 +267,24 @@ def _create_mirror_circuit(
 
     # Remove measurements and barriers at the end of the circuit before mirroring.
     target_qc.remove_final_measurements(inplace=True)
-    qc_inv = target_qc.inverse()
+    original_instructions = list(target_qc.data)
 
     # Place a barrier on all active qubits to prevent optimization passes from fully reducing the mirror circuit.
-    dag = circuit_to_dag(target_qc)
-    active_qubits = [qubit for qubit in target_qc.qubits if qubit not in dag.idle_wires()]
+    used_qubits = {qubit for instruction in original_instructions for qubit in instruction.qubits}
+    active_qubits = [qubit for qubit in target_qc.qubits if qubit in used_qubits]
     target_qc.barrier(active_qubits)
 
-    # Form the mirror circuit by composing the original circuit with its inverse.
-    target_qc.compose(qc_inv, inplace=True)
+    # Form the mirror circuit by appending the inverse of each instruction in reverse order.
+    # The circuit and its inverse share the same wires, so no intermediate circuit has to be built and composed.
+    for instruction in reversed(original_instructions):
+        target_qc._append(instruction.replace(operation=instruction.operation.inverse()))  # noqa: SLF001
+    # The global phases of the circuit and its inverse cancel out.
+    target_qc.global_phase = 0
 
     # Transpile to ensure the final circuit uses only native gates while preserving the initial layout.
     if target is not None:
+        from qiskit.compiler import transpile  # noqa: PLC0415
+
         layout = target_qc.layout.initial_layout if target_qc.layout is not None else None
         target_qc = transpile(
             target_qc,
@@ -138,20 +308,112 @@ def _create_mirror_circuit(
 
     # Reset the permutation caused by routing back to the identity (all SWAPs are undone by the inverse).
     if target_qc.layout is not None:
-        target_qc.layout.final_layout = Layout.generate_trivial_layout(*target_qc.qregs)
+        target_qc.layout.final_layout = _get_trivial_layout(tuple(target_qc.qregs)).copy()
 
     return target_qc
 
 
-def _validate_opt_level(opt_level: int) -> None:
-    """Validate optimization level.
+@lru_cache(maxsize=64)
+def _get_vendor(description: str) -> str | None:
+    """Return the vendor with custom gate equivalences that a target description refers to, if any.
 
     Arguments:
+        description: Description of the target.
+    """
+    return next((vendor for vendor in _VENDOR_EQUIVALENCES if vendor in description), None)
+
+
+def _ensure_equivalences(description: str | None) -> None:
+    """Register the custom gate equivalences required by a target, at most once per session.
+
+    Arguments:
+        description: Description of the target, used to identify the vendor.
+    """
+    vendor = _get_vendor(description or "")
+    if vendor is None or vendor in _REGISTERED_EQUIVALENCES:
+        return
+
+    from qiskit.circuit import SessionEquivalenceLibrary  # noqa: PLC0415
+
+    _VENDOR_EQUIVALENCES[vendor].add_equivalences(SessionEquivalenceLibrary)
+    _REGISTERED_EQUIVALENCES.add(vendor)
+
+
+@cache
+def _get_clifford_t_rotations_target(num_qubits: int) -> Target:
+    """Return the intermediate Clifford+T+rotations target used for Clifford+T compilation.
+
+    The target is only read by the transpiler, so a single instance per qubit count is shared
+    instead of deep-copying a fresh one for every call.
+
+    Arguments:
+        num_qubits: Number of qubits of the target.
+    """
+    return get_target_for_gateset("clifford+t+rotations", num_qubits=num_qubits)
+
+
+@cache
+def _get_solovay_kitaev_pass_manager() -> PassManager:
+    """Return the pass manager synthesizing single-qubit rotations into Clifford+T gates.
+
+    The pass manager is built (and its passes imported) on first use only and reused afterwards.
+    """
+    from qiskit.transpiler import PassManager  # noqa: PLC0415
+    from qiskit.transpiler.passes.synthesis import SolovayKitaev  # noqa: PLC0415
+
+    return PassManager(SolovayKitaev())
+
+
+@lru_cache(maxsize=16)
+def _get_preset_pass_manager(
+    target: Target | None, opt_level: int, *, native_gates_only: bool = False
+) -> StagedPassManager:
+    """Return the seeded preset pass manager compiling circuits for a target.
+
+    Pass managers are cached per target object and optimization level, since building them is
+    comparatively expensive and they can be reused for any number of runs. As documented in the
+    public API, targets must not be modified after they have been used for compilation.
+
+    Arguments:
+        target: Target the pass manager compiles to, or None for target-independent compilation.
+        opt_level: Optimization level of the pass manager.
+        native_gates_only: If True, the layout, routing, and scheduling stages are removed so that
+            circuits are only translated to the target's native gates without being mapped.
+    """
+    from qiskit import generate_preset_pass_manager  # noqa: PLC0415
+
+    pm = generate_preset_pass_manager(optimization_level=opt_level, target=target, seed_transpiler=10)
+    if native_gates_only:
+        pm.layout = None
+        pm.routing = None
+        pm.scheduling = None
+    return pm
+
+
+def _prepare_circuit(
+    benchmark: str | QuantumCircuit,
+    circuit_size: int | None,
+    opt_level: int,
+    random_parameters: bool,
+) -> QuantumCircuit:
+    """Validate the optimization level and create the circuit to be compiled.
+
+    Shared prologue of all benchmark levels that invoke the transpiler. The optimization level is
+    validated first so that invalid requests fail before any circuit is constructed.
+
+    Arguments:
+        benchmark: QuantumCircuit or name of the benchmark to be generated.
+        circuit_size: Input for the benchmark creation, in most cases this is equal to the qubit number.
         opt_level: User-defined optimization level.
+        random_parameters: If True, assigns random parameters to the circuit's parameters if they exist.
+
+    Returns:
+        The circuit to be compiled.
     """
     if not 0 <= opt_level <= 3:
         msg = f"Invalid `opt_level` '{opt_level}'. Must be in the range [0, 3]."
         raise ValueError(msg)
+    return _get_circuit(benchmark, circuit_size, random_parameters)
 
 
 @overload
@@ -240,10 +502,8 @@ def get_benchmark_indep(
     Returns:
             Qiskit::QuantumCircuit expressed in a generic basis gate set, still unmapped to any physical device.
     """
-    _validate_opt_level(opt_level)
-
-    circuit = _get_circuit(benchmark, circuit_size, random_parameters)
-    qc_processed = transpile(circuit, optimization_level=opt_level, seed_transpiler=10)
+    circuit = _prepare_circuit(benchmark, circuit_size, opt_level, random_parameters)
+    qc_processed = _get_preset_pass_manager(None, opt_level).run(circuit)
     if generate_mirror_circuit:
         return _create_mirror_circuit(qc_processed, inplace=True)
     return qc_processed
@@ -284,6 +544,10 @@ def get_benchmark_native_gates(
 ) -> QuantumCircuit:
     """Return a benchmark compiled to the target's native gate set.
 
+    The compilation setup is cached per ``target`` object and optimization level. To benefit from it
+    when generating many benchmarks, pass the same ``target`` object to every call (instead of a
+    fresh `get_device` copy each time), and do not modify a target after it has been used here.
+
     Arguments:
             benchmark: QuantumCircuit or name of the benchmark to be generated
             circuit_size: Input for the benchmark creation, in most cases this is equal to the qubit number
@@ -295,38 +559,21 @@ def get_benchmark_native_gates(
     Returns:
             Qiskit::QuantumCircuit whose operations are restricted to ``target``'s native gate set but are **not** yet qubit-mapped to a concrete device connectivity.
     """
-    _validate_opt_level(opt_level)
-
-    circuit = _get_circuit(benchmark, circuit_size, random_parameters)
+    circuit = _prepare_circuit(benchmark, circuit_size, opt_level, random_parameters)
 
     if target.description == "clifford+t":
-        from qiskit.transpiler import PassManager  # noqa: PLC0415
-        from qiskit.transpiler.passes.synthesis import SolovayKitaev  # noqa: PLC0415
-
         # Transpile the circuit to single- and two-qubit gates including rotations
-        clifford_t_rotations = get_target_for_gateset("clifford+t+rotations", num_qubits=circuit.num_qubits)
-        compiled_for_sk = transpile(
-            circuit,
-            target=clifford_t_rotations,
-            optimization_level=opt_level,
-            seed_transpiler=10,
-        )
+        clifford_t_rotations = _get_clifford_t_rotations_target(circuit.num_qubits)
+        compiled_for_sk = _get_preset_pass_manager(clifford_t_rotations, opt_level).run(circuit)
         # Synthesize the rotations to Clifford+T gates
-        # Measurements are removed and added back after the synthesis to avoid errors in the Solovay-Kitaev pass
-        pm = PassManager(SolovayKitaev())
-        circuit = pm.run(compiled_for_sk.remove_final_measurements(inplace=False))
+        # Measurements are removed and added back after the synthesis to avoid errors in the Solovay-Kitaev pass.
+        # The transpiled circuit is not used otherwise, so the measurements can be removed without copying it.
+        compiled_for_sk.remove_final_measurements(inplace=True)
+        circuit = _get_solovay_kitaev_pass_manager().run(compiled_for_sk)
         circuit.measure_all()
 
-    if "rigetti" in target.description:
-        rigetti.add_equivalences(SessionEquivalenceLibrary)
-    elif "ionq" in target.description:
-        ionq.add_equivalences(SessionEquivalenceLibrary)
-    pm = generate_preset_pass_manager(optimization_level=opt_level, target=target, seed_transpiler=10)
-    pm.layout = None
-    pm.routing = None
-    pm.scheduling = None
-
-    compiled_circuit = pm.run(circuit)
+    _ensure_equivalences(target.description)
+    compiled_circuit = _get_preset_pass_manager(target, opt_level, native_gates_only=True).run(circuit)
     if generate_mirror_circuit:
         return _create_mirror_circuit(compiled_circuit, inplace=True, target=target, optimization_level=opt_level)
     return compiled_circuit
@@ -367,6 +614,10 @@ def get_benchmark_mapped(
 ) -> QuantumCircuit:
     """Return a benchmark fully compiled and qubit-mapped to a device.
 
+    The compilation setup is cached per ``target`` object and optimization level. To benefit from it
+    when generating many benchmarks, pass the same ``target`` object to every call (instead of a
+    fresh `get_device` copy each time), and do not modify a target after it has been used here.
+
     Arguments:
             benchmark: QuantumCircuit or name of the benchmark to be generated
             circuit_size: Input for the benchmark creation, in most cases this is equal to the qubit number
@@ -378,21 +629,10 @@ def get_benchmark_mapped(
     Returns:
             Qiskit::QuantumCircuit that has been decomposed and routed onto the connectivity described by ``target``.
     """
-    _validate_opt_level(opt_level)
-
-    circuit = _get_circuit(benchmark, circuit_size, random_parameters)
+    circuit = _prepare_circuit(benchmark, circuit_size, opt_level, random_parameters)
 
-    if "rigetti" in target.description:
-        rigetti.add_equivalences(SessionEquivalenceLibrary)
-    elif "ionq" in target.description:
-        ionq.add_equivalences(SessionEquivalenceLibrary)
-
-    mapped_circuit = transpile(
-        circuit,
-        target=target,
-        optimization_level=opt_level,
-        seed_transpiler=10,
-    )
+    _ensure_equivalences(target.description)
+    mapped_circuit = _get_preset_pass_manager(target, opt_level).run(circuit)
     if generate_mirror_circuit:
         return _create_mirror_circuit(mapped_circuit, inplace=True, target=target, optimization_level=opt_level)
     return mapped_circuit
@@ -441,7 +681,8 @@ def get_benchmark(
         level: Choice of level
         circuit_size: Input for the benchmark creation, in most cases this is equal to the qubit number
         target: `~qiskit.transpiler.target.Target` for the benchmark generation
-                (only used for "nativegates" and "mapped" level)
+                (only used for "nativegates" and "mapped" level; must not be modified after use,
+                see `get_benchmark_native_gates` and `get_benchmark_mapped`)
         opt_level: Optimization level to be used by the transpiler.
         generate_mirror_circuit: If True, generates the mirror version (U @ U.inverse()) of the benchmark.
         random_parameters: If True, assigns random parameters to the circuit's parameters if they exist.
@@ -449,47 +690,143 @@ def get_benchmark(
     Returns:
         Qiskit::QuantumCircuit object representing the benchmark with the selected options
     """
-    if level is BenchmarkLevel.ALG:
-        return get_benchmark_alg(
-            benchmark=benchmark,
-            circuit_size=circuit_size,
-            generate_mirror_circuit=generate_mirror_circuit,
-            random_parameters=random_parameters,
-        )
+    handler = _LEVEL_DISPATCH.get(level)
+    if handler is None:
+        msg = f"Unreachable benchmark level {level!r}."
+        raise AssertionError(msg)
+    return handler(benchmark, circuit_size, target, opt_level, generate_mirror_circuit, random_parameters)
 
-    if level is BenchmarkLevel.INDEP:
-        return get_benchmark_indep(
-            benchmark=benchmark,
-            circuit_size=circuit_size,
-            opt_level=opt_level,
-            generate_mirror_circuit=generate_mirror_circuit,
-            random_parameters=random_parameters,
-        )
 
-    if level is BenchmarkLevel.NATIVEGATES:
-        if target is None:
-            msg = "Target must be provided for 'nativegates' level."
-            raise ValueError(msg)
-        return get_benchmark_native_gates(
-            benchmark=benchmark,
-            circuit_size=circuit_size,
-            target=target,
-            opt_level=opt_level,
-            generate_mirror_circuit=generate_mirror_circuit,
-            random_parameters=random_parameters,
-        )
+def _dispatch_alg(
+    benchmark: str | QuantumCircuit,
+    circuit_size: int | None,
+    _target: Target | None,
+    _opt_level: int,
+    generate_mirror_circuit: bool,
+    random_parameters: bool,
+) -> QuantumCircuit:
+    """Dispatch `get_benchmark` to the algorithm level; target and optimization level are ignored."""
+    return get_benchmark_alg(
+        benchmark=benchmark,
+        circuit_size=circuit_size,
+        generate_mirror_circuit=generate_mirror_circuit,
+        random_parameters=random_parameters,
+    )
 
-    if level is BenchmarkLevel.MAPPED:
-        if target is None:
-            msg = "Target must be provided for 'mapped' level."
-            raise ValueError(msg)
-        return get_benchmark_mapped(
-            benchmark=benchmark,
-            circuit_size=circuit_size,
-            target=target,
-            opt_level=opt_level,
-            generate_mirror_circuit=generate_mirror_circuit,
-            random_parameters=random_parameters,
-        )
 
-    assert_never(level)
+def _dispatch_indep(
+    benchmark: str | QuantumCircuit,
+    circuit_size: int | None,
+    _target: Target | None,
+    opt_level: int,
+    generate_mirror_circuit: bool,
+    random_parameters: bool,
+) -> QuantumCircuit:
+    """Dispatch `get_benchmark` to the target-independent level; the target is ignored."""
+    return get_benchmark_indep(
+        benchmark=benchmark,
+        circuit_size=circuit_size,
+        opt_level=opt_level,
+        generate_mirror_circuit=generate_mirror_circuit,
+        random_parameters=random_parameters,
+    )
+
+
+def _dispatch_native_gates(
+    benchmark: str | QuantumCircuit,
+    circuit_size: int | None,
+    target: Target | None,
+    opt_level: int,
+    generate_mirror_circuit: bool,
+    random_parameters: bool,
+) -> QuantumCircuit:
+    """Dispatch `get_benchmark` to the native-gates level."""
+    if target is None:
+        msg = "Target must be provided for 'nativegates' level."
+        raise ValueError(msg)
+    return get_benchmark_native_gates(
+        benchmark=benchmark,
+        circuit_size=circuit_size,
+        target=target,
+        opt_level=opt_level,
+        generate_mirror_circuit=generate_mirror_circuit,
+        random_parameters=random_parameters,
+    )
+
+
+def _dispatch_mapped(
+    benchmark: str | QuantumCircuit,
+    circuit_size: int | None,
+    target: Target | None,
+    opt_level: int,
+    generate_mirror_circuit: bool,
+    random_parameters: bool,
+) -> QuantumCircuit:
+    """Dispatch `get_benchmark` to the mapped level."""
+    if target is None:
+        msg = "Target must be provided for 'mapped' level."
+        raise ValueError(msg)
+    return get_benchmark_mapped(
+        benchmark=benchmark,
+        circuit_size=circuit_size,
+        target=target,
+        opt_level=opt_level,
+        generate_mirror_circuit=generate_mirror_circuit,
+        random_parameters=random_parameters,
+    )
+
+
+_LevelHandler = Callable[
+    [str | QuantumCircuit, int | None, "Target | None", int, bool, bool],
+    QuantumCircuit,
+]
+
+_LEVEL_DISPATCH: dict[BenchmarkLevel, _LevelHandler] = {
+    BenchmarkLevel.ALG: _dispatch_alg,
+    BenchmarkLevel.INDEP: _dispatch_indep,
+    BenchmarkLevel.NATIVEGATES: _dispatch_native_gates,
+    BenchmarkLevel.MAPPED: _dispatch_mapped,
+}
+
+
+def _get_benchmark_from_spec(spec: Mapping[str, Any]) -> QuantumCircuit:
+    """Worker entry point of `get_benchmarks_batch`; must be importable for process pools.
+
+    Circuits passed as ``benchmark`` are copied, so that the caller's circuits are never modified,
+    regardless of whether the spec is processed in a worker or in the current process.
+    """
+    if isinstance(spec.get("benchmark"), QuantumCircuit):
+        spec = {**spec, "benchmark": spec["benchmark"].copy()}
+    return get_benchmark(**spec)
+
+
+def get_benchmarks_batch(
+    specs: Iterable[Mapping[str, Any]],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> list[QuantumCircuit]:
+    """Returns multiple benchmarks, generated in parallel worker processes.
+
+    Each benchmark is generated independently, so the work is distributed over a process pool.
+    Worker processes are started via ``spawn`` on all platforms, since forking the (multithreaded)
+    parent process after Qiskit has been used can deadlock. As required by `multiprocessing` for
+    ``spawn``, scripts calling this function must guard their entry point with
+    ``if __name__ == "__main__":``.
+
+    Arguments:
+        specs: Keyword arguments of `get_benchmark` for each benchmark, e.g.
+            ``{"benchmark": "ghz", "level": BenchmarkLevel.INDEP, "circuit_size": 5}``.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+            With a single worker, the benchmarks are generated in the current process.
+        chunksize: Number of benchmarks submitted to a worker at once.
+
+    Returns:
+        List of the generated benchmarks, in the order of `specs`.
+    """
+    specs = list(specs)
+    if max_workers == 1 or len(specs) <= 1:
+        return [_get_benchmark_from_spec(spec) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(_get_benchmark_from_spec, specs, chunksize=chunksize))
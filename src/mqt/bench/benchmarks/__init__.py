@@ -20,6 +20,7 @@ from ._registry import (
     benchmark_description,
     benchmark_names,
     get_benchmark_by_name,
+    is_registered,
     register_benchmark,
 )
 
@@ -30,11 +31,11 @@ if TYPE_CHECKING:
     from qiskit.circuit import QuantumCircuit
 
 
-_DISCOVERED_BENCHMARKS: set[str] = {
+_DISCOVERED_BENCHMARKS: frozenset[str] = frozenset(
     path.stem
     for entry in ir.files(__package__).iterdir()
     if (path := cast("Path", entry)).is_file() and path.suffix == ".py" and not path.stem.startswith("_")
-}
+)
 
 _IMPORTED_BENCHMARKS: set[str] = set()
 
@@ -60,7 +61,7 @@ def _ensure_loaded(benchmark_name: str) -> None:
     Raises:
         ValueError: If the provided benchmark name is not supported or not available in the discovered benchmarks.
     """
-    if benchmark_name in benchmark_names():
+    if is_registered(benchmark_name):
         return  # already imported and registered
 
     if benchmark_name not in _DISCOVERED_BENCHMARKS:
@@ -76,7 +77,7 @@ def _ensure_loaded(benchmark_name: str) -> None:
 
 def get_available_benchmark_names() -> list[str]:
     """Return a list of available benchmark names."""
-    return sorted(_DISCOVERED_BENCHMARKS | set(benchmark_names())).copy()
+    return sorted(_DISCOVERED_BENCHMARKS.union(benchmark_names()))
 
 
 @cache
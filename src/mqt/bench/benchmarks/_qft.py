@@ -0,0 +1,24 @@
+# Copyright (c) 2023 - 2025 Chair for Design Automation, TUM
+# Copyright (c) 2025 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""QFT building blocks shared by the QFT-based arithmetic benchmarks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from qiskit.synthesis import synth_qft_full
+
+if TYPE_CHECKING:
+    from qiskit.circuit import Gate
+
+
+def get_qft_gates(num_qubits: int) -> tuple[Gate, Gate]:
+    """Return a new QFT gate without swaps on `num_qubits` qubits together with its inverse."""
+    qft_gate = synth_qft_full(num_qubits, do_swaps=False).to_gate()
+    return qft_gate, qft_gate.inverse()
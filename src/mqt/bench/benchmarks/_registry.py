@@ -36,6 +36,9 @@ _REGISTRY: dict[str, BenchmarkInfo] = {}
 def register_benchmark(benchmark_name: str, description: str = "") -> Callable[[_BenchmarkFactory], _BenchmarkFactory]:
     """Decorator to register a benchmark factory under a unique `benchmark_name`.
 
+    Circuits of named benchmarks are cached per benchmark name and size, so the factory must be
+    deterministic, e.g., by seeding any randomness it uses.
+
     Arguments:
         benchmark_name: unique identifier for the benchmark (e.g., ``"ae"``).
         description: One-line description.
@@ -84,6 +87,18 @@ def benchmark_description(benchmark_name: str) -> str:
     return _REGISTRY[benchmark_name].description
 
 
+def is_registered(benchmark_name: str) -> bool:
+    """Return whether a benchmark is registered under `benchmark_name`.
+
+    Arguments:
+        benchmark_name: identifier used during registration.
+
+    Returns:
+        True if the benchmark is registered, False otherwise.
+    """
+    return benchmark_name in _REGISTRY
+
+
 def benchmark_names() -> list[str]:
     """Return all registered benchmark names."""
     return list(_REGISTRY)
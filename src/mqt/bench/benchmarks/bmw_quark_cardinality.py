@@ -24,16 +24,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from qiskit.circuit import ParameterVector, QuantumCircuit
-from qiskit.circuit.library import RXXGate
 
 from ._registry import register_benchmark
 
-if TYPE_CHECKING:
-    from qiskit.circuit import Parameter
-
 
 @register_benchmark("bmw_quark_cardinality", description="Cardinality Circuit (QUARK)")
 def create_circuit(num_qubits: int, depth: int = 3) -> QuantumCircuit:
@@ -52,37 +46,30 @@ def create_circuit(num_qubits: int, depth: int = 3) -> QuantumCircuit:
     num_final_layer = 3 * num_qubits if depth >= 2 else 0
     total_params = num_initial + num_rxx + num_mid_layers + num_final_layer
 
-    param_vector = ParameterVector("p", length=total_params)
-
-    param_index = 0
-
-    def get_param() -> Parameter:
-        nonlocal param_index
-        param = param_vector[param_index]
-        param_index += 1
-        return param
+    # Parameters are consumed in order from a single iterator over the vector.
+    params = iter(ParameterVector("p", length=total_params))
 
     # === Initial single-qubit rotations ===
     for q in range(num_qubits):
-        qc.rx(get_param(), q)
-        qc.rz(get_param(), q)
+        qc.rx(next(params), q)
+        qc.rz(next(params), q)
 
     # === Layered structure ===
     for d in range(depth):
         qc.barrier()
         for q in range(num_qubits - 1):
-            qc.append(RXXGate(get_param()), [q, q + 1])
+            qc.rxx(next(params), q, q + 1)
         qc.barrier()
 
         if d == depth - 2:
             for q in range(num_qubits):
-                qc.rx(get_param(), q)
-                qc.rz(get_param(), q)
-                qc.rx(get_param(), q)
+                qc.rx(next(params), q)
+                qc.rz(next(params), q)
+                qc.rx(next(params), q)
         elif d < depth - 2:
             for q in range(num_qubits):
-                qc.rx(get_param(), q)
-                qc.rz(get_param(), q)
+                qc.rx(next(params), q)
+                qc.rz(next(params), q)
 
     qc.measure_all()
     qc.name = "bmw_quark_cardinality"
@@ -24,16 +24,13 @@
 
 from __future__ import annotations
 
+from itertools import combinations
 from math import comb
-from typing import TYPE_CHECKING
 
 from qiskit.circuit import ParameterVector, QuantumCircuit
 
 from ._registry import register_benchmark
 
-if TYPE_CHECKING:
-    from qiskit.circuit import Parameter
-
 
 @register_benchmark("bmw_quark_copula", description="Copula Circuit (QUARK)")
 def create_circuit(num_qubits: int, depth: int = 2) -> QuantumCircuit:
@@ -54,23 +51,17 @@ def create_circuit(num_qubits: int, depth: int = 2) -> QuantumCircuit:
     num_rxx_gates = depth * n_registers * comb(n, 2)
     total_params = num_single_qubit_gates + num_rxx_gates
 
-    param_vector = ParameterVector("p", total_params)
-
-    param_index = 0
+    # Parameters are consumed in order from a single iterator over the vector.
+    params = iter(ParameterVector("p", total_params))
 
-    def get_param() -> Parameter:
-        nonlocal param_index
-        value = param_vector[param_index]
-        param_index += 1
-        return value
+    # Qubit pairs of the intra-register RXX gates (full connectivity within each register).
+    rxx_pairs = [pair for reg in range(n_registers) for pair in combinations(range(reg * n, (reg + 1) * n), 2)]
 
     # === Initial Hadamards on first register ===
-    for q in range(n):
-        qc.h(q)
+    qc.h(range(n))
 
     # === CNOTs to entangle registers ===
-    for q in range(n):
-        qc.cx(q, q + n)
+    qc.cx(range(n), range(n, num_qubits))
 
     qc.barrier()
 
@@ -78,16 +69,13 @@ def create_circuit(num_qubits: int, depth: int = 2) -> QuantumCircuit:
     for _ in range(depth):
         # Apply RZ-RX-RZ to each qubit
         for q in range(num_qubits):
-            qc.rz(get_param(), q)
-            qc.rx(get_param(), q)
-            qc.rz(get_param(), q)
+            qc.rz(next(params), q)
+            qc.rx(next(params), q)
+            qc.rz(next(params), q)
 
         # Intra-register RXX (full connectivity)
-        for reg in range(n_registers):
-            base = reg * n
-            for i in range(n):
-                for j in range(i + 1, n):
-                    qc.rxx(get_param(), base + i, base + j)
+        for q0, q1 in rxx_pairs:
+            qc.rxx(next(params), q0, q1)
 
         qc.barrier()
 
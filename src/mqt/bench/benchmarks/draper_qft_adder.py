@@ -24,10 +24,12 @@
 
 from __future__ import annotations
 
+from math import ldexp
+
 import numpy as np
 from qiskit.circuit import QuantumCircuit, QuantumRegister
-from qiskit.synthesis import synth_qft_full
 
+from ._qft import get_qft_gates
 from ._registry import register_benchmark
 
 
@@ -76,20 +78,19 @@ def create_circuit(num_qubits: int, kind: str = "fixed") -> QuantumCircuit:
         num_qubits_qft = num_state_qubits
 
     # build QFT adder circuit
-    qft_circ = synth_qft_full(num_qubits_qft, do_swaps=False)
-    qft_gate = qft_circ.to_gate()
-    inv_qft_gate = qft_gate.inverse()
+    qft_gate, inv_qft_gate = get_qft_gates(num_qubits_qft)
     qc.append(qft_gate, qr_sum)
 
+    # phase angles pi / 2**k, computed once instead of once per controlled-phase gate
+    lams = [ldexp(np.pi, -k) for k in range(num_state_qubits + 1)]
+
     for j in range(num_state_qubits):
         for k in range(num_state_qubits - j):
-            lam = np.pi / (2**k)
-            qc.cp(lam, qr_a[j], qr_b[j + k])
+            qc.cp(lams[k], qr_a[j], qr_b[j + k])
 
     if kind == "half":
         for j in range(num_state_qubits):
-            lam = np.pi / (2 ** (j + 1))
-            qc.cp(lam, qr_a[num_state_qubits - j - 1], qr_z[0])
+            qc.cp(lams[j + 1], qr_a[num_state_qubits - j - 1], qr_z[0])
 
     qc.append(inv_qft_gate, qr_sum)
 
@@ -10,6 +10,8 @@
 
 from __future__ import annotations
 
+from math import ldexp
+
 import numpy as np
 from qiskit.circuit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import QFTGate
@@ -50,18 +52,20 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
     t = 2 * np.pi
     lam = 3.618  # simulate dominant eigenvalue for better realism
 
+    # Phase angles of the controlled unitaries, reused (negated) for the uncomputation in step 6
+    angles = [ldexp(t * lam, -(j + 1)) for j in range(num_qpe_qubits)]
     for j in range(num_qpe_qubits):
-        angle = t * lam / (2 ** (j + 1))
-        qc.cp(angle, qr_eig[j], qr_sys[0])
+        qc.cp(angles[j], qr_eig[j], qr_sys[0])
 
     # Step 4: Apply inverse QFT
-    qc.append(QFTGate(num_qpe_qubits).inverse(), qr_eig)
+    qft_gate = QFTGate(num_qpe_qubits)
+    qc.append(qft_gate.inverse(), qr_eig)
 
     # Step 5: Controlled Ry rotations on ancilla (based on actual eigenvalue)
     for j in range(num_qpe_qubits):
         # Approximate eigenvalue encoded in basis state |j⟩
         # Use inverse λ (scaled appropriately)
-        estimated_lambda = lam / (2 ** (num_qpe_qubits - j))
+        estimated_lambda = ldexp(lam, -(num_qpe_qubits - j))
         if estimated_lambda > 0:
             inv_lambda = 1.0 / estimated_lambda
             inv_lambda = np.clip(inv_lambda, -1, 1)  # valid for arcsin
@@ -69,10 +73,9 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
             qc.cry(theta, qr_eig[j], qr_anc[0])
 
     # Step 6: QPE uncomputation (apply QFT + reverse controlled unitary)
-    qc.append(QFTGate(num_qpe_qubits), qr_eig)
+    qc.append(qft_gate, qr_eig)
     for j in reversed(range(num_qpe_qubits)):
-        angle = -t * lam / (2 ** (j + 1))
-        qc.cp(angle, qr_eig[j], qr_sys[0])
+        qc.cp(-angles[j], qr_eig[j], qr_sys[0])
 
     # Step 7: Final Hadamards and measurement
     qc.h(qr_eig)
@@ -70,13 +70,15 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
     # build multiplication circuit
     qc = QuantumCircuit(*qregs)
 
+    # the controlled adder and the qubits it acts on besides the output are the same in every step,
+    # so they are only determined once
+    num_adder_qubits = num_state_qubits
+    controlled_adder = adder.to_gate().control(1)
+    b_qubits = qr_b[:num_adder_qubits]
+    helper_qubits = qr_helper[:] if qr_helper else []
+
     for i in range(num_state_qubits):
-        num_adder_qubits = num_state_qubits
-        adder_for_current_step = adder
-        controlled_adder = adder_for_current_step.to_gate().control(1)
-        qr_list = [qr_a[i], *qr_b[:num_adder_qubits], *qr_out[i : num_state_qubits + i + 1]]
-        if num_helper_qubits > 0 and qr_helper:
-            qr_list.extend(qr_helper[:])
+        qr_list = [qr_a[i], *b_qubits, *qr_out[i : num_state_qubits + i + 1], *helper_qubits]
         qc.append(controlled_adder, qr_list)
 
     qc.measure_all()
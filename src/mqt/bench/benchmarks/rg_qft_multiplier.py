@@ -24,10 +24,12 @@
 
 from __future__ import annotations
 
+from math import ldexp
+
 import numpy as np
 from qiskit.circuit import QuantumCircuit, QuantumRegister
-from qiskit.synthesis import synth_qft_full
 
+from ._qft import get_qft_gates
 from ._registry import register_benchmark
 
 
@@ -57,20 +59,17 @@ def create_circuit(num_qubits: int) -> QuantumCircuit:
     qr_out = QuantumRegister(num_result_qubits, name="out")
     qc = QuantumCircuit(qr_a, qr_b, qr_out)
 
-    qft_circ = synth_qft_full(num_result_qubits, do_swaps=False)
-    qft_gate = qft_circ.to_gate()
-    inv_qft_gate = qft_gate.inverse()
+    qft_gate, inv_qft_gate = get_qft_gates(num_result_qubits)
     qc.append(qft_gate, qr_out)
 
+    # phase angles only depend on i + j + k, so they are computed once per exponent instead of once per gate
+    lams = [ldexp(2 * np.pi, 2 * num_state_qubits - m) for m in range(2 * num_state_qubits + num_result_qubits + 1)]
+
     for j in range(1, num_state_qubits + 1):
         for i in range(1, num_state_qubits + 1):
+            controls = [qr_a[num_state_qubits - j], qr_b[num_state_qubits - i]]
             for k in range(1, num_result_qubits + 1):
-                lam = (2 * np.pi) / (2 ** (i + j + k - 2 * num_state_qubits))
-                qc.mcp(
-                    lam,
-                    [qr_a[num_state_qubits - j], qr_b[num_state_qubits - i]],
-                    qr_out[k - 1],
-                )
+                qc.mcp(lams[i + j + k], controls, qr_out[k - 1])
 
     qc.append(inv_qft_gate, qr_out)
 
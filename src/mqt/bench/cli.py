@@ -100,18 +100,11 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    if args.level == "alg":
-        level = BenchmarkLevel.ALG
-    elif args.level == "indep":
-        level = BenchmarkLevel.INDEP
-    elif args.level == "nativegates":
-        level = BenchmarkLevel.NATIVEGATES
-    else:
-        level = BenchmarkLevel.MAPPED
+    level = BenchmarkLevel[args.level.upper()]
 
-    if level == BenchmarkLevel.NATIVEGATES:
+    if level is BenchmarkLevel.NATIVEGATES:
         target = get_target_for_gateset(args.target, num_qubits=args.num_qubits)
-    elif level == BenchmarkLevel.MAPPED:
+    elif level is BenchmarkLevel.MAPPED:
         target = get_device(args.target)
     else:
         target = None
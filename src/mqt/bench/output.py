@@ -10,9 +10,9 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import date
 from enum import Enum
-from importlib import metadata
 from io import TextIOBase
 from pathlib import Path
 from typing import TYPE_CHECKING, TextIO, overload
@@ -22,15 +22,21 @@ from qiskit.qasm2 import dump as dump2
 from qiskit.qasm3 import dump as dump3
 from qiskit.qpy import dump as dump_qpy
 
+from ._metadata import get_installed_version
 from .benchmark_generation import BenchmarkLevel
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator
     from typing import BinaryIO
 
     from qiskit.circuit import QuantumCircuit
     from qiskit.transpiler import Target
 
 
+# Levels whose output depends on a compilation target.
+_TARGET_LEVELS = frozenset({BenchmarkLevel.NATIVEGATES, BenchmarkLevel.MAPPED})
+
+
 class OutputFormat(str, Enum):
     """Enumeration of supported output formats for circuit export."""
 
@@ -47,11 +53,18 @@ class MQTBenchExporterError(Exception):
     """Custom exception for errors arising during MQT Bench exporting operations."""
 
 
-def _attach_metadata(qc: QuantumCircuit, header: str) -> QuantumCircuit:
-    """Return *a shallow copy* whose ``metadata`` carries the MQT-Bench header."""
-    clone = qc.copy()
-    clone.metadata = (clone.metadata or {}) | {"mqt_bench": header}
-    return clone
+@contextmanager
+def _attach_metadata(qc: QuantumCircuit, header: str) -> Generator[QuantumCircuit]:
+    """Temporarily let the ``metadata`` of *qc* carry the MQT-Bench header.
+
+    The original metadata is restored on exit, which avoids copying the whole circuit just for serialization.
+    """
+    original = qc.metadata
+    qc.metadata = (original or {}) | {"mqt_bench": header}
+    try:
+        yield qc
+    finally:
+        qc.metadata = original
 
 
 def generate_header(
@@ -68,17 +81,21 @@ def generate_header(
 
     Returns:
         A string containing the formatted header.
+
+    Raises:
+        MQTBenchExporterError: If the `mqt.bench` package is not installed.
+        ValueError: If no target is given for the nativegates or mapped level.
     """
     try:
-        version = metadata.version("mqt.bench")
-    except Exception as exc:
+        version = get_installed_version()
+    except Exception as err:
         msg = (
             "The Python package `mqt.bench` is not installed in the current "
             "environment. Install it with\n\n"
             "    pip install mqt.bench\n\n"
-            f"and try again. (Original error: {exc})"
+            f"and try again. (Original error: {err})"
         )
-        raise MQTBenchExporterError(msg) from None
+        raise MQTBenchExporterError(msg) from err
 
     lines: list[str] = []
     lines.extend((
@@ -89,14 +106,16 @@ def generate_header(
         f"// Output format: {fmt.value}",
     ))
 
-    if level in {BenchmarkLevel.NATIVEGATES, BenchmarkLevel.MAPPED}:
-        assert target is not None, "Target must be provided for nativegates or mapped level."
+    if level in _TARGET_LEVELS:
+        if target is None:
+            msg = "Target must be provided for nativegates or mapped level."
+            raise ValueError(msg)
         lines.extend((
             f"// Level: {level.name.lower()}",
             f"// Target: {target.description}",
             f"// Used gateset: {list(target.operation_names)}",
         ))
-        if level == BenchmarkLevel.MAPPED:
+        if level is BenchmarkLevel.MAPPED:
             c_map = target.build_coupling_map()
             lines.append(f"// Coupling map: {c_map or 'all-to-all'}")
 
@@ -167,7 +186,8 @@ def write_circuit(
                 msg = "QPY output requires a *binary* stream."
                 raise MQTBenchExporterError(msg)
             try:
-                dump_qpy(_attach_metadata(qc, header), destination)
+                with _attach_metadata(qc, header) as tagged:
+                    dump_qpy(tagged, destination)
             except Exception as exc:
                 msg = f"Failed to write QPY stream. (Original error: {exc})"
                 raise MQTBenchExporterError(msg) from None
@@ -187,8 +207,8 @@ def write_circuit(
 
     elif fmt is OutputFormat.QPY:
         try:
-            with destination.open("wb") as f:
-                dump_qpy(_attach_metadata(qc, header), f)
+            with destination.open("wb") as f, _attach_metadata(qc, header) as tagged:
+                dump_qpy(tagged, f)
         except Exception as exc:
             msg = f"Failed to write QPY file to {destination}. (Original error: {exc})"
             raise MQTBenchExporterError(msg) from None
@@ -250,18 +270,28 @@ def generate_filename(
     Returns:
         A string representing a filename (excluding extension) that encodes
         all relevant metadata for reproducibility and clarity.
+
+    Raises:
+        ValueError: If the optimization level or target required by the level is missing.
     """
     base = f"{benchmark_name}_{level.name.lower()}{'_mirror' if generate_mirror_circuit else ''}"
 
-    if level == BenchmarkLevel.INDEP:
-        assert opt_level is not None, "opt_level is required for 'indep' level filenames."
+    if level is BenchmarkLevel.INDEP:
+        if opt_level is None:
+            msg = "opt_level is required for 'indep' level filenames."
+            raise ValueError(msg)
         return f"{base}_opt{opt_level}_{num_qubits}"
 
-    if level in {BenchmarkLevel.NATIVEGATES, BenchmarkLevel.MAPPED}:
-        assert opt_level is not None, f"opt_level is required for '{level.name.lower()}' level filenames."
-        assert target is not None, f"target is required for '{level.name.lower()}' level filenames."
+    if level in _TARGET_LEVELS:
+        if opt_level is None:
+            msg = f"opt_level is required for '{level.name.lower()}' level filenames."
+            raise ValueError(msg)
+        if target is None:
+            msg = f"target is required for '{level.name.lower()}' level filenames."
+            raise ValueError(msg)
         # sanitize the target.description to remove any special characters etc.
-        description = target.description.strip().split(" ")[0]
+        # (only the first word is used, so the split stops after it)
+        description = target.description.strip().split(" ", 1)[0]
         return f"{base}_{description}_opt{opt_level}_{num_qubits}"
 
     return f"{base}_{num_qubits}"
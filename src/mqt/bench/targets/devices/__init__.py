@@ -72,7 +72,7 @@ def get_available_device_names() -> list[str]:
         importlib.import_module(f"{__package__}.{module}")
         _IMPORTED_MODULES.add(module)
 
-    return sorted(device_names()).copy()
+    return sorted(device_names())
 
 
 @cache
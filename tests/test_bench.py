@@ -14,6 +14,8 @@ import builtins
 import functools
 import io
 import re
+import subprocess
+import sys
 from datetime import date
 from enum import Enum
 from importlib import metadata
@@ -22,7 +24,7 @@ from typing import TYPE_CHECKING, NoReturn, cast
 
 import pytest
 from qiskit import QuantumCircuit, qpy
-from qiskit.circuit import Parameter
+from qiskit.circuit import Gate, Parameter
 from qiskit.circuit.library import CXGate, HGate, RXGate, RZGate, XGate
 from qiskit.compiler import transpile
 from qiskit.transpiler import (
@@ -35,8 +37,10 @@ from qiskit.transpiler.passes import GatesInBasis, RemoveBarriers
 
 if TYPE_CHECKING:  # pragma: no cover
     import types
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
+from mqt.bench import benchmark_generation
+from mqt.bench._metadata import get_installed_version  # noqa: PLC2701
 from mqt.bench.benchmark_generation import (
     BenchmarkLevel,
     get_benchmark,
@@ -44,6 +48,7 @@ from mqt.bench.benchmark_generation import (
     get_benchmark_indep,
     get_benchmark_mapped,
     get_benchmark_native_gates,
+    get_benchmarks_batch,
 )
 from mqt.bench.benchmarks import (
     create_circuit,
@@ -190,6 +195,18 @@ def test_wrong_circuit_size(benchmark_name: str, input_value: int, kind: str | N
         create_circuit(*params)
 
 
+@pytest.mark.parametrize("benchmark_name", ["draper_qft_adder", "rg_qft_multiplier"])
+def test_qft_arithmetic_circuits_do_not_share_gates(benchmark_name: str) -> None:
+    """Circuits of the QFT-based arithmetic benchmarks own their QFT gates."""
+    first = create_circuit(benchmark_name, 4)
+    second = create_circuit(benchmark_name, 4)
+
+    # The QFT gates and their inverses are the only custom (non-library) gates in these circuits.
+    first_gate_ids = {id(instruction.operation) for instruction in first.data if type(instruction.operation) is Gate}
+    assert first_gate_ids
+    assert all(id(instruction.operation) not in first_gate_ids for instruction in second.data)
+
+
 def test_bv() -> None:
     """Test the creation of the BV benchmark."""
     qc = create_circuit("bv", 3)
@@ -521,6 +538,22 @@ def test_generate_filename(
     assert filename == expected
 
 
+@pytest.mark.parametrize(
+    ("level", "target", "opt_level", "match"),
+    [
+        (BenchmarkLevel.INDEP, None, None, "opt_level is required for 'indep' level filenames."),
+        (BenchmarkLevel.MAPPED, get_device("ibm_falcon_127"), None, "opt_level is required for 'mapped' level"),
+        (BenchmarkLevel.NATIVEGATES, None, 2, "target is required for 'nativegates' level filenames."),
+    ],
+)
+def test_generate_filename_missing_arguments(
+    level: BenchmarkLevel, target: Target | None, opt_level: int | None, match: str
+) -> None:
+    """Test that missing arguments for a filename are reported even when assertions are disabled."""
+    with pytest.raises(ValueError, match=re.escape(match)):
+        generate_filename(benchmark_name="ghz", level=level, num_qubits=5, target=target, opt_level=opt_level)
+
+
 @pytest.fixture(autouse=True)
 def temp_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Ensure all files go into a temporary directory."""
@@ -528,6 +561,14 @@ def temp_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     return tmp_path
 
 
+@pytest.fixture(autouse=True)
+def clear_version_cache() -> Iterator[None]:
+    """Ensure monkeypatched package metadata is seen by the cached version lookup."""
+    get_installed_version.cache_clear()
+    yield
+    get_installed_version.cache_clear()
+
+
 def test_generate_header_minimal(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test the generation of a minimal header."""
     monkeypatch.setattr(metadata, "version", lambda _: "9.9.9")
@@ -572,6 +613,13 @@ def test_generate_header_with_options(monkeypatch: pytest.MonkeyPatch) -> None:
     assert f"// Coupling map: {cmap}" in hdr
 
 
+@pytest.mark.parametrize("level", [BenchmarkLevel.NATIVEGATES, BenchmarkLevel.MAPPED])
+def test_generate_header_missing_target(level: BenchmarkLevel) -> None:
+    """Headers of target-dependent levels require a target."""
+    with pytest.raises(ValueError, match=re.escape("Target must be provided for nativegates or mapped level.")):
+        generate_header(OutputFormat.QASM3, level)
+
+
 def test_generate_header_pkg_not_installed(monkeypatch: pytest.MonkeyPatch) -> None:
     """metadata.version raises PackageNotFoundError."""
     monkeypatch.setattr(
@@ -585,6 +633,8 @@ def test_generate_header_pkg_not_installed(monkeypatch: pytest.MonkeyPatch) -> N
     msg = str(exc.value)
     assert "not installed" in msg.lower()
     assert "mqt.bench" in msg
+    assert "boom" in msg
+    assert isinstance(exc.value.__cause__, MQTBenchExporterError)
 
 
 @pytest.mark.parametrize("fmt", [OutputFormat.QASM2, OutputFormat.QASM3])
@@ -607,10 +657,11 @@ def test_write_circuit_qasm(tmp_path: Path, fmt: OutputFormat) -> None:
 
 def test_write_circuit_qpy(tmp_path: Path) -> None:
     """Test writing a QPY circuit with header embedded in metadata."""
-    qc = QuantumCircuit(1)
+    qc = QuantumCircuit(1, metadata={"origin": "test"})
     qc.x(0)
     out = tmp_path / "test.qpy"
     write_circuit(qc, out, BenchmarkLevel.INDEP, fmt=OutputFormat.QPY)
+    assert qc.metadata == {"origin": "test"}, "the exported circuit must not be modified"
 
     data = out.read_bytes()
     assert data.startswith(b"QISKIT"), "QPY file must start with the QISKIT magic"
@@ -621,6 +672,7 @@ def test_write_circuit_qpy(tmp_path: Path) -> None:
     circ = loaded[0]
     assert isinstance(circ, QuantumCircuit)
 
+    assert circ.metadata["origin"] == "test"
     header = circ.metadata["mqt_bench"]
     assert header.startswith(f"// Benchmark created by MQT Bench on {date.today()}")
     assert "// MQT Bench version:" in header
@@ -884,12 +936,12 @@ def test_target_must_be_supplied(benchmark: str, size: int, opt_level: int) -> N
         )
 
 
-def test_assert_never_runtime() -> None:
-    """Test that assert_never raises an error at runtime."""
+def test_unknown_level_runtime() -> None:
+    """Test that an unknown level raises an error at runtime."""
     bad_level = cast("BenchmarkLevel", object())
 
-    with pytest.raises(AssertionError):
-        # get_benchmark will fall through the if-chain and hit assert_never
+    with pytest.raises(AssertionError, match="Unreachable benchmark level"):
+        # get_benchmark finds no handler in the dispatch table
         get_benchmark("qft", level=bad_level, circuit_size=3)
 
 
@@ -1077,3 +1129,150 @@ def test_benchmarks_with_parameters(benchmark: types.ModuleType) -> None:
         res_mapped = get_benchmark_mapped(qc, None, device, 0, random_parameters=False)
         assert res_mapped
         assert len(res_mapped.parameters) > 0, f"Benchmark {benchmark} should have parameters on the mapped level."
+
+
+def test_top_level_subpackages_are_attributes() -> None:
+    """Subpackages of ``mqt.bench`` are available as attributes after a plain ``import mqt.bench``."""
+    code = (
+        "import mqt.bench; "
+        "print(mqt.bench.benchmark_generation.__name__, mqt.bench.benchmarks.__name__, mqt.bench.targets.__name__)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    assert result.stdout.split() == ["mqt.bench.benchmark_generation", "mqt.bench.benchmarks", "mqt.bench.targets"]
+
+
+def test_random_parameters_are_reproducible() -> None:
+    """Random parameters are bound to all parameters and are identical across calls."""
+    qc_params = get_benchmark("vqe_su2", BenchmarkLevel.ALG, 4, random_parameters=False)
+    first = get_benchmark("vqe_su2", BenchmarkLevel.ALG, 4)
+    second = get_benchmark("vqe_su2", BenchmarkLevel.ALG, 4)
+
+    assert len(qc_params.parameters) > 0
+    assert len(first.parameters) == 0
+    assert first == second
+
+
+def test_equivalences_registered_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Vendor-specific gate equivalences are only added to the session library once."""
+    from mqt.bench.targets.gatesets import rigetti  # noqa: PLC0415
+
+    calls: list[object] = []
+    add_equivalences = rigetti.add_equivalences
+
+    def _counting_add_equivalences(sel: object) -> None:
+        calls.append(sel)
+        add_equivalences(sel)
+
+    monkeypatch.setattr(benchmark_generation, "_REGISTERED_EQUIVALENCES", set())
+    monkeypatch.setattr(rigetti, "add_equivalences", _counting_add_equivalences)
+
+    get_benchmark_native_gates("ghz", 3, get_target_for_gateset("rigetti", 3), 0)
+    get_benchmark_native_gates("ghz", 3, get_target_for_gateset("rigetti", 3), 0)
+    get_benchmark_mapped("ghz", 3, get_device("rigetti_ankaa_84"), 0)
+
+    assert len(calls) == 1
+
+
+def test_named_benchmark_circuits_are_cached_copies() -> None:
+    """Named benchmarks are served from a cache, but callers always receive an independent copy."""
+    first = get_benchmark_alg("graphstate", 5)
+    first.x(0)
+    second = get_benchmark_alg("graphstate", 5)
+    third = get_benchmark_alg("graphstate", 5)
+
+    assert second is not third
+    assert second == third
+    assert first != second
+
+
+def test_pass_manager_is_reused_for_the_same_target() -> None:
+    """Compiling repeatedly for the same target object reuses the cached pass manager."""
+    target = get_device("ibm_falcon_27")
+    get_benchmark_mapped("ghz", 3, target, 1)
+    hits = benchmark_generation._get_preset_pass_manager.cache_info().hits  # noqa: SLF001
+    get_benchmark_mapped("dj", 3, target, 1)
+
+    assert benchmark_generation._get_preset_pass_manager.cache_info().hits == hits + 1  # noqa: SLF001
+
+
+def test_invalid_benchmark_type() -> None:
+    """Benchmarks that are neither a name nor a QuantumCircuit are rejected before any work is done."""
+    with pytest.raises(TypeError, match=re.escape("`benchmark` must be a str or a QuantumCircuit, got int.")):
+        get_benchmark(cast("str", 42), BenchmarkLevel.ALG, 3)
+
+
+@pytest.fixture
+def persistent_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Enable the persistent circuit cache in a temporary directory, bypassing the in-memory cache."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("MQT_BENCH_CACHE_DIR", str(cache_dir))
+    benchmark_generation._build_circuit.cache_clear()  # noqa: SLF001
+    yield cache_dir
+    benchmark_generation._build_circuit.cache_clear()  # noqa: SLF001
+
+
+def test_persistent_circuit_cache(persistent_cache_dir: Path) -> None:
+    """Circuits of named benchmarks are stored in and served from the opt-in persistent cache."""
+    qc = get_benchmark_alg("full_adder", 4)
+    assert len(list(persistent_cache_dir.glob("*.pickle"))) == 1
+
+    benchmark_generation._build_circuit.cache_clear()  # noqa: SLF001
+    assert get_benchmark_alg("full_adder", 4) == qc
+    assert len(list(persistent_cache_dir.glob("*.pickle"))) == 1
+
+
+def test_persistent_circuit_cache_corrupt_entry(persistent_cache_dir: Path) -> None:
+    """Corrupt entries of the persistent cache are treated as cache misses and rewritten."""
+    qc = get_benchmark_alg("full_adder", 4)
+    (entry,) = persistent_cache_dir.glob("*.pickle")
+    entry.write_bytes(entry.read_bytes()[:10])
+
+    benchmark_generation._build_circuit.cache_clear()  # noqa: SLF001
+    assert get_benchmark_alg("full_adder", 4) == qc
+
+    benchmark_generation._build_circuit.cache_clear()  # noqa: SLF001
+    assert get_benchmark_alg("full_adder", 4) == qc
+    assert list(persistent_cache_dir.iterdir()) == [entry]
+
+
+def test_persistent_circuit_cache_unwritable_dir(persistent_cache_dir: Path) -> None:
+    """Benchmarks are still generated if the persistent cache directory cannot be created."""
+    persistent_cache_dir.write_text("", encoding="utf-8")
+
+    assert get_benchmark_alg("full_adder", 4).num_qubits == 4
+    assert persistent_cache_dir.is_file()
+
+
+def test_get_benchmarks_batch() -> None:
+    """Benchmarks generated in worker processes match the ones generated sequentially."""
+    specs = [
+        {"benchmark": "ghz", "level": BenchmarkLevel.ALG, "circuit_size": 3},
+        {"benchmark": "qft", "level": BenchmarkLevel.INDEP, "circuit_size": 4, "opt_level": 1},
+        {
+            "benchmark": "dj",
+            "level": BenchmarkLevel.NATIVEGATES,
+            "circuit_size": 3,
+            "target": get_target_for_gateset("ionq_forte", 3),
+            "opt_level": 0,
+        },
+    ]
+
+    parallel = get_benchmarks_batch(specs, max_workers=2)
+    sequential = get_benchmarks_batch(specs, max_workers=1)
+
+    assert parallel == sequential
+    assert [qc.name for qc in parallel] == ["ghz", "qft", "dj"]
+
+
+def test_get_benchmarks_batch_keeps_circuit_specs() -> None:
+    """Circuits passed in specs are not modified, whether benchmarks are generated in workers or not."""
+    qc = QuantumCircuit(1)
+    qc.rx(Parameter("theta"), 0)
+    specs = [{"benchmark": qc, "level": BenchmarkLevel.ALG, "generate_mirror_circuit": True}] * 2
+
+    parallel = get_benchmarks_batch(specs, max_workers=2)
+    sequential = get_benchmarks_batch(specs, max_workers=1)
+
+    assert parallel == sequential
+    assert qc.num_parameters == 1
+    assert len(qc.data) == 1